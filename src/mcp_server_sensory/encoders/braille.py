@@ -17,7 +17,9 @@ both humans (trained) and machines (sensors)!
 Part of HumoticaOS McMurdo Off-Grid Communication
 """
 
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+
+import numpy as np
 
 # Braille dot positions:
 # 1 4
@@ -42,9 +44,39 @@ BRAILLE_MAP = {
 # Number indicator (precedes numbers in proper Braille)
 NUMBER_INDICATOR = '⠼'
 
+# Unicode Braille starts at U+2800; the low 6 bits are the raised dots
+# (1=dot1, 2=dot2, 4=dot3, 8=dot4, 16=dot5, 32=dot6)
+_BITS = {char: ord(cell) - 0x2800 for char, cell in BRAILLE_MAP.items()}
+
+# str.translate table for encode(); unmapped characters pass through.
+# Uppercase letters are included, so ASCII text needs no case fold.
+_ENCODE_TABLE = {ord(char): 0x2800 + bits for char, bits in _BITS.items()}
+_ENCODE_TABLE.update(
+    {ord(char.upper()): 0x2800 + bits for char, bits in _BITS.items() if char.isalpha()}
+)
+
+# Dot code for every character to_dot_matrix() accepts: mapped text
+# characters and the Braille cells they map to
+_DOT_CODES = {cell: ord(cell) - 0x2800 for cell in BRAILLE_MAP.values()}
+_DOT_CODES.update(_BITS)
+
 # Reverse lookup
 BRAILLE_TO_CHAR = {v: k for k, v in BRAILLE_MAP.items() if k.isalpha()}
 
+# str.translate table for decode(): letters and the blank cell decode,
+# number indicators are dropped, anything else passes through
+_DECODE_TABLE = str.maketrans({**BRAILLE_TO_CHAR, '⠀': ' ', NUMBER_INDICATOR: None})
+
+# Cells indexed by dot code (offset from U+2800), for vectorized grids.
+# Each row holds dots (1, 4), (2, 5), (3, 6) plus a zero separator column.
+_DOT_BITS = np.array([[1, 8], [2, 16], [4, 32]])
+_GRID_TABLE = np.zeros((64, 3, 3), dtype=np.uint8)
+_GRID_TABLE[:, :, :2] = (np.arange(64)[:, None, None] & _DOT_BITS) != 0
+
+# Dot codes that BRAILLE_MAP produces; to_dot_matrix() treats others as blank
+_IS_MAPPED_CELL = np.zeros(64, dtype=bool)
+_IS_MAPPED_CELL[list(_BITS.values())] = True
+
 
 def encode(text: str, include_number_indicators: bool = False) -> str:
     """
@@ -57,13 +89,19 @@ def encode(text: str, include_number_indicators: bool = False) -> str:
     Returns:
         Braille string
     """
+    if not include_number_indicators:
+        # Unmapped non-ASCII characters are passed through lowercased
+        if not text.isascii():
+            text = text.lower()
+        return text.translate(_ENCODE_TABLE)
+
     text = text.lower()
     result = []
     in_number = False
 
     for char in text:
         if char.isdigit():
-            if include_number_indicators and not in_number:
+            if not in_number:
                 result.append(NUMBER_INDICATOR)
                 in_number = True
         else:
@@ -87,26 +125,7 @@ def decode(braille: str) -> str:
     Returns:
         Decoded text
     """
-    result = []
-    skip_next = False
-
-    for char in braille:
-        if skip_next:
-            skip_next = False
-            continue
-
-        if char == NUMBER_INDICATOR:
-            skip_next = False  # Next char is a number
-            continue
-
-        if char in BRAILLE_TO_CHAR:
-            result.append(BRAILLE_TO_CHAR[char])
-        elif char == '⠀':
-            result.append(' ')
-        else:
-            result.append(char)
-
-    return ''.join(result)
+    return braille.translate(_DECODE_TABLE)
 
 
 def to_dot_matrix(char: str) -> List[List[bool]]:
@@ -121,15 +140,8 @@ def to_dot_matrix(char: str) -> List[List[bool]]:
         [1][0] [1][1]   (dots 2, 5)
         [2][0] [2][1]   (dots 3, 6)
     """
-    if char not in BRAILLE_MAP.values():
-        if char in BRAILLE_MAP:
-            char = BRAILLE_MAP[char]
-        else:
-            return [[False, False], [False, False], [False, False]]
-
-    # Unicode Braille starts at U+2800
-    # The pattern is encoded in the lower 8 bits
-    code = ord(char) - 0x2800
+    # Unmapped characters are a blank cell
+    code = _DOT_CODES.get(char, 0)
 
     # Bit positions: 1=dot1, 2=dot2, 4=dot3, 8=dot4, 16=dot5, 32=dot6
     matrix = [
@@ -141,6 +153,19 @@ def to_dot_matrix(char: str) -> List[List[bool]]:
     return matrix
 
 
+def _cell_codes(text: str) -> np.ndarray:
+    """
+    Dot codes for each cell of encode(text), as to_dot_matrix() reads them.
+
+    Characters without a Braille cell get code 0 (no raised dots).
+    """
+    braille = encode(text).encode('utf-32-le', 'surrogatepass')
+    codes = np.frombuffer(braille, dtype='<u4').astype(np.int64) - 0x2800
+    codes[(codes < 0) | (codes >= 64)] = 0
+    codes[~_IS_MAPPED_CELL[codes]] = 0
+    return codes
+
+
 def to_punchcard_pattern(text: str, cell_width: int = 4, cell_height: int = 6) -> str:
     """
     Convert text to ASCII art punchcard pattern.
@@ -158,26 +183,33 @@ def to_punchcard_pattern(text: str, cell_width: int = 4, cell_height: int = 6) -
     Returns:
         ASCII art string representing punchcard
     """
-    braille = encode(text)
-    matrices = [to_dot_matrix(char) for char in braille]
+    return '\n'.join(iter_punchcard_rows(text, cell_width, cell_height))
+
 
+def iter_punchcard_rows(text: str, cell_width: int = 4, cell_height: int = 6) -> Iterator[str]:
+    """
+    Yield the lines of to_punchcard_pattern() one at a time.
+
+    Lets callers stream very long patterns without building the whole string.
+    """
+    codes = _cell_codes(text)
     dot_char = '●'
     empty_char = '○'
     row_scale = cell_height // 3
-    col_scale = cell_width // 2
-
-    lines = [[] for _ in range(cell_height)]
+    col_scale = max(cell_width // 2, 0)
 
-    for matrix in matrices:
-        for row_idx, row in enumerate(matrix):
-            for scale in range(row_scale):
-                line_idx = row_idx * row_scale + scale
-                for col_idx, dot in enumerate(row):
-                    char = dot_char if dot else empty_char
-                    lines[line_idx].extend([char] * col_scale)
-                lines[line_idx].append(' ')  # Cell separator
+    # All cells for one dot row are rendered at once as a line of code points
+    separators = np.full((len(codes), 1), ord(' '), dtype='<u4')
+    for row_idx in range(3 if row_scale > 0 else 0):
+        dots = _GRID_TABLE[codes, row_idx, :2].repeat(col_scale, axis=1)
+        cells = np.where(dots, ord(dot_char), ord(empty_char)).astype('<u4')
+        line = np.concatenate([cells, separators], axis=1).tobytes().decode('utf-32-le')
+        for _ in range(row_scale):
+            yield line
 
-    return '\n'.join([''.join(line) for line in lines])
+    # Rows past the last multiple of 3 stay empty
+    for _ in range(cell_height - 3 * max(row_scale, 0)):
+        yield ''
 
 
 def to_binary_grid(text: str) -> List[List[int]]:
@@ -192,20 +224,21 @@ def to_binary_grid(text: str) -> List[List[int]]:
     Returns:
         2D list of 0s and 1s
     """
-    braille = encode(text)
-    matrices = [to_dot_matrix(char) for char in braille]
+    return to_binary_grid_array(text).tolist()
 
-    # Combine all matrices horizontally
-    if not matrices:
-        return []
 
-    grid = [[] for _ in range(3)]
-    for matrix in matrices:
-        for row_idx, row in enumerate(matrix):
-            grid[row_idx].extend([int(dot) for dot in row])
-            grid[row_idx].append(0)  # Separator
+def to_binary_grid_array(text: str) -> np.ndarray:
+    """
+    Same grid as to_binary_grid(), as a 3-row uint8 array.
+
+    Empty text gives an empty (0, 0) array.
+    """
+    codes = _cell_codes(text)
+    if not codes.size:
+        return np.zeros((0, 0), dtype=np.uint8)
 
-    return grid
+    # Gather every cell at once, then lay the cells out side by side
+    return _GRID_TABLE[codes].transpose(1, 0, 2).reshape(3, -1)
 
 
 def from_binary_grid(grid: List[List[int]]) -> str:
@@ -44,6 +44,30 @@ MORSE_CODE = {
 # Reverse lookup
 MORSE_TO_CHAR = {v: k for k, v in MORSE_CODE.items()}
 
+# Direct ASCII lookup, indexed by character code ('' = no Morse equivalent).
+# Lowercase letters share their uppercase entry, so ASCII needs no case fold.
+_ENC = [''] * 128
+for _char, _code in MORSE_CODE.items():
+    _ENC[ord(_char)] = _code
+    _ENC[ord(_char.lower())] = _code
+_ENC = tuple(_ENC)
+
+# Visual: █ for dash, ▄ for dot
+_VISUAL_TO_STANDARD = str.maketrans({'█': '-', '▄': '.'})
+_ENC_VISUAL = tuple(code.translate({ord('-'): '█', ord('.'): '▄'}) for code in _ENC)
+
+# Binary: 111 for dash, 1 for dot, 0 for gap
+_ENC_BINARY = tuple(
+    code.translate({ord('-'): '111', ord('.'): '1', ord('/'): '0000000'})
+    for code in _ENC
+)
+
+# Per-format (lookup table, letter separator); other formats encode as standard
+_FORMAT_TABLES = {
+    MorseFormat.VISUAL: (_ENC_VISUAL, ' '),
+    MorseFormat.BINARY: (_ENC_BINARY, '0'),
+}
+
 
 def encode(text: str, format: MorseFormat = MorseFormat.STANDARD) -> str:
     """
@@ -56,26 +80,15 @@ def encode(text: str, format: MorseFormat = MorseFormat.STANDARD) -> str:
     Returns:
         Morse code string in specified format
     """
-    text = text.upper()
-    morse_parts = []
-
-    for char in text:
-        if char in MORSE_CODE:
-            morse_parts.append(MORSE_CODE[char])
-        elif char == ' ':
-            morse_parts.append('/')
-
-    morse = ' '.join(morse_parts)
-
-    if format == MorseFormat.VISUAL:
-        # █ for dash, ▄ for dot
-        morse = morse.replace('-', '█').replace('.', '▄')
-    elif format == MorseFormat.BINARY:
-        # 111 for dash, 1 for dot, 0 for gap
-        morse = morse.replace('-', '111').replace('.', '1')
-        morse = morse.replace(' ', '0').replace('/', '0000000')
-
-    return morse
+    # Everything in MORSE_CODE is ASCII, so other characters can be dropped
+    # up front and the rest looked up by byte value. Non-ASCII text is still
+    # upper-cased first, since some characters fold to ASCII ('ß' -> 'SS').
+    if text.isascii():
+        data = text.encode('ascii')
+    else:
+        data = text.upper().encode('ascii', 'ignore')
+    table, separator = _FORMAT_TABLES.get(format, (_ENC, ' '))
+    return separator.join([table[b] for b in data if table[b]])
 
 
 def decode(morse: str) -> str:
@@ -89,20 +102,30 @@ def decode(morse: str) -> str:
         Decoded text
     """
     # Normalize visual format back to standard
-    morse = morse.replace('█', '-').replace('▄', '.')
+    morse = morse.translate(_VISUAL_TO_STANDARD)
+
+    # '/' decodes to ' ', so word gaps need no separate pass
+    return ''.join([MORSE_TO_CHAR.get(token, '') for token in morse.split(' ')])
 
-    words = morse.split(' / ')
-    decoded_words = []
 
-    for word in words:
-        chars = word.split(' ')
-        decoded_word = ''
-        for char in chars:
-            if char in MORSE_TO_CHAR:
-                decoded_word += MORSE_TO_CHAR[char]
-        decoded_words.append(decoded_word)
+def _token_units(token: str) -> tuple:
+    """
+    Timing of one space-free Morse token as (units, is_on) pairs.
+    """
+    units = []
+    for i, char in enumerate(token):
+        if char == '.' or char == '-':
+            units.append((1 if char == '.' else 3, True))
+            # Gap after element (unless end or word gap follows)
+            if i + 1 < len(token) and token[i + 1] != '/':
+                units.append((1, False))
+        elif char == '/':
+            units.append((7, False))  # Word gap
+    return tuple(units)
+
 
-    return ' '.join(decoded_words)
+# Precomputed timing for every valid Morse token (including '/')
+_TIMING = {code: _token_units(code) for code in MORSE_TO_CHAR}
 
 
 def to_timing(morse: str, unit_ms: int = 100) -> list:
@@ -123,30 +146,23 @@ def to_timing(morse: str, unit_ms: int = 100) -> list:
     Returns:
         List of (duration_ms, is_on) tuples
     """
-    timing = []
-    morse = morse.replace('█', '-').replace('▄', '.')
-
-    i = 0
-    while i < len(morse):
-        char = morse[i]
-
-        if char == '.':
-            timing.append((unit_ms, True))
-            # Gap after element (unless end or space follows)
-            if i + 1 < len(morse) and morse[i + 1] not in ' /':
-                timing.append((unit_ms, False))
-        elif char == '-':
-            timing.append((unit_ms * 3, True))
-            if i + 1 < len(morse) and morse[i + 1] not in ' /':
-                timing.append((unit_ms, False))
-        elif char == ' ':
-            timing.append((unit_ms * 3, False))  # Letter gap
-        elif char == '/':
-            timing.append((unit_ms * 7, False))  # Word gap
-
-        i += 1
-
-    return timing
+    morse = morse.translate(_VISUAL_TO_STANDARD)
+
+    # Spaces are letter gaps; everything between them comes from the table
+    units = []
+    for i, token in enumerate(morse.split(' ')):
+        if i:
+            units.append((3, False))  # Letter gap
+        if token in _TIMING:
+            units.extend(_TIMING[token])
+        else:
+            units.extend(_token_units(token))
+
+    # Single units are unit_ms exactly as passed in, as before
+    return [
+        (unit_ms if count == 1 else count * unit_ms, is_on)
+        for count, is_on in units
+    ]
 
 
 def to_image_pattern(text: str, dot_size: int = 10) -> list:
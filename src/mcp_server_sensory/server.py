@@ -10,6 +10,9 @@ Part of HumoticaOS McMurdo Off-Grid Communication Layer.
 
 import asyncio
 import json
+import threading
+from collections import OrderedDict
+from functools import wraps
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp.server.stdio import stdio_server
@@ -18,387 +21,625 @@ from .encoders import morse, braille, sstv
 from .decoders import sstv as sstv_decoder
 import base64
 
+# orjson is optional; it serializes the bulk grid/timing replies much faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Create server instance
 server = Server("sensory")
 
 
+def _tc(text: str) -> TextContent:
+    """Text content for a tool reply, skipping validation of our own strings."""
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _dumps(data) -> str:
+    """JSON for grid/timing replies, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; json.dumps handles those
+    if hasattr(data, "tolist"):
+        data = data.tolist()
+    return json.dumps(data)
+
+
+# Text arguments longer than this are encoded in a worker thread, and
+# bypass the result caches below
+_OFFLOAD_THRESHOLD = 2048
+
+
+def _is_large(args) -> bool:
+    """True if any text argument is longer than _OFFLOAD_THRESHOLD."""
+    return any(isinstance(arg, str) and len(arg) > _OFFLOAD_THRESHOLD for arg in args)
+
+
+# Each result cache holds at most this many characters of keys and results,
+# and never keeps a single entry larger than _MAX_CACHED_CHARS
+_CACHE_BUDGET = 1024 * 1024
+_MAX_CACHED_CHARS = 16 * 1024
+
+
+def _small_cache(maxsize: int):
+    """
+    LRU cache for small calls, bounded by entry count and total size.
+
+    Calls with large text arguments, or results over _MAX_CACHED_CHARS,
+    are computed but not stored. Keys include argument types, so 100
+    and 100.0 are cached separately.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        used = 0
+
+        @wraps(fn)
+        def wrapper(*args):
+            nonlocal used
+            if _is_large(args):
+                return fn(*args)
+
+            key = tuple((type(arg), arg) for arg in args)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key][0]
+
+            result = fn(*args)
+            size = len(result) + sum(len(arg) for arg in args if isinstance(arg, str))
+            if size > _MAX_CACHED_CHARS:
+                return result
+
+            with lock:
+                if key not in cache:
+                    cache[key] = (result, size)
+                    used += size
+                    while len(cache) > maxsize or used > _CACHE_BUDGET:
+                        _, (_, old_size) = cache.popitem(last=False)
+                        used -= old_size
+            return result
+
+        def cache_clear():
+            nonlocal used
+            with lock:
+                cache.clear()
+                used = 0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+# The text encoders are pure, and MCP clients tend to repeat the same
+# small payloads, so memoize them for the tool handlers below.
+# Large inputs are not cached, so they can't pin big results in memory.
+_morse_encode = _small_cache(4096)(morse.encode)
+_morse_decode = _small_cache(4096)(morse.decode)
+_braille_encode = _small_cache(4096)(braille.encode)
+_braille_decode = _small_cache(4096)(braille.decode)
+
+
+# Punchcards larger than this are returned as several text blocks
+_CHUNK_CHARS = 16 * 1024
+
+
+def _punchcard_size(text: str, cell_width: int, cell_height: int) -> int:
+    """Rough character count of a punchcard pattern."""
+    return len(text) * (max(cell_width, 0) + 1) * cell_height
+
+
+_cached_punchcard = _small_cache(512)(braille.to_punchcard_pattern)
+
+
+def _braille_punchcard(text: str, cell_width: int = 4, cell_height: int = 6) -> str:
+    """Punchcard pattern, cached only while it fits in a single reply block."""
+    if _punchcard_size(text, cell_width, cell_height) > _CHUNK_CHARS:
+        return braille.to_punchcard_pattern(text, cell_width, cell_height)
+    return _cached_punchcard(text, cell_width, cell_height)
+
+
+@_small_cache(2048)
+def _morse_timing_json(text: str, unit_ms: int) -> str:
+    """Morse timing for text, cached as serialized JSON."""
+    return _dumps(morse.to_timing(_morse_encode(text), unit_ms))
+
+
+@_small_cache(2048)
+def _braille_grid_json(text: str) -> str:
+    """Binary grid for text, cached as serialized JSON."""
+    return _dumps(braille.to_binary_grid_array(text))
+
+
+# transcode stages: source format -> text, and text -> target format
+_TRANSCODE_DECODERS = {
+    "morse": _morse_decode,
+    "braille": _braille_decode,
+}
+_TRANSCODE_ENCODERS = {
+    "morse": _morse_encode,
+    "morse_visual": lambda text: _morse_encode(text, morse.MorseFormat.VISUAL),
+    "braille": _braille_encode,
+    "punchcard": _braille_punchcard,
+}
+
+
+def _pipeline(decoder, encoder):
+    """Compose the transcode stages; None means the stage is plain text."""
+    if decoder is None:
+        return encoder
+    if encoder is None:
+        return decoder
+    return lambda data: encoder(decoder(data))
+
+
+# Every (from_format, to_format) pair, composed once at import
+_TRANSCODE = {
+    (src, dst): _pipeline(decoder, encoder)
+    for src, decoder in [("text", None), *_TRANSCODE_DECODERS.items()]
+    for dst, encoder in [("text", None), *_TRANSCODE_ENCODERS.items()]
+    if src != dst
+}
+
+
+async def _run(fn, *args):
+    """Call fn(*args), off the event loop if any text argument is large."""
+    if _is_large(args):
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+def _punchcard_chunks(text: str, cell_width: int, cell_height: int) -> list[str]:
+    """Punchcard pattern split into _CHUNK_CHARS slices, in order."""
+    def pieces():
+        for i, row in enumerate(braille.iter_punchcard_rows(text, cell_width, cell_height)):
+            if i:
+                yield "\n"
+            yield row
+
+    chunks = []
+    current = ""
+    for piece in pieces():
+        start = 0
+        while start < len(piece):
+            take = _CHUNK_CHARS - len(current)
+            current += piece[start:start + take]
+            start += take
+            if len(current) == _CHUNK_CHARS:
+                chunks.append(current)
+                current = ""
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+# Tool definitions are static, so build them once at import
+_TOOLS = (
+    Tool(
+        name="morse_encode",
+        description="Encode text to Morse code. Formats: standard (.-), visual (█▄), binary (10)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to encode"},
+                "format": {
+                    "type": "string",
+                    "enum": ["standard", "visual", "binary"],
+                    "default": "standard",
+                    "description": "Output format"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="morse_decode",
+        description="Decode Morse code back to text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "morse": {"type": "string", "description": "Morse code to decode"}
+            },
+            "required": ["morse"]
+        }
+    ),
+    Tool(
+        name="morse_timing",
+        description="Get timing data for Morse audio/light generation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to convert"},
+                "unit_ms": {"type": "integer", "default": 100, "description": "Base time unit in milliseconds"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="braille_encode",
+        description="Encode text to Braille Unicode characters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to encode"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="braille_decode",
+        description="Decode Braille back to text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "braille": {"type": "string", "description": "Braille text to decode"}
+            },
+            "required": ["braille"]
+        }
+    ),
+    Tool(
+        name="braille_punchcard",
+        description="Generate ASCII punchcard pattern from text - can be physically punched for audit trail!",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to convert"},
+                "cell_width": {"type": "integer", "default": 4, "description": "Width of each cell"},
+                "cell_height": {"type": "integer", "default": 6, "description": "Height of each cell"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="braille_binary_grid",
+        description="Generate binary grid for machine-readable punchcard or CNC/laser cutting",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to convert"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="transcode",
+        description="Convert between different sensory encodings",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input": {"type": "string", "description": "Input data"},
+                "from_format": {
+                    "type": "string",
+                    "enum": ["text", "morse", "braille"],
+                    "description": "Source format"
+                },
+                "to_format": {
+                    "type": "string",
+                    "enum": ["text", "morse", "braille", "morse_visual", "punchcard"],
+                    "description": "Target format"
+                }
+            },
+            "required": ["input", "from_format", "to_format"]
+        }
+    ),
+    # SSTV Tools - "Een 7B model krijgt opeens ogen"
+    Tool(
+        name="sstv_encode_text",
+        description="Encode text to SSTV audio (Robot36/Martin/Scottie). Returns base64 WAV. Multi-modal bridge for small LLMs!",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to encode into image then SSTV audio"},
+                "mode": {
+                    "type": "string",
+                    "enum": ["robot36", "robot8bw", "robot24bw", "martin1", "martin2", "scottie1", "scottie2"],
+                    "default": "robot36",
+                    "description": "SSTV mode (robot36 is fastest)"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="sstv_encode_ponskaart",
+        description="Create authenticated ponskaart (punch card) for McMurdo remote authentication via SSTV",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "string", "description": "User identifier"},
+                "auth_token": {"type": "string", "description": "Authentication token"},
+                "command": {"type": "string", "description": "Command to execute remotely"},
+                "mode": {
+                    "type": "string",
+                    "enum": ["robot36", "robot8bw", "robot24bw", "martin1", "martin2", "scottie1", "scottie2"],
+                    "default": "robot36",
+                    "description": "SSTV mode"
+                }
+            },
+            "required": ["user_id", "auth_token", "command"]
+        }
+    ),
+    Tool(
+        name="sstv_modes",
+        description="List available SSTV modes with their specifications",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    # SSTV Decode - Complete the REFLUX loop!
+    Tool(
+        name="sstv_detect",
+        description="Detect if audio contains an SSTV signal. First step of REFLUX decode.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "audio_base64": {"type": "string", "description": "Base64 encoded WAV audio"}
+            },
+            "required": ["audio_base64"]
+        }
+    ),
+    Tool(
+        name="sstv_decoder_info",
+        description="Get SSTV decoder capabilities and REFLUX readiness status",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="reflux_decode",
+        description="Complete REFLUX decode: SSTV Audio → Image → OCR → Text. Gives small LLMs 'eyes' via audio!",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "audio_base64": {"type": "string", "description": "Base64 encoded SSTV WAV audio"}
+            },
+            "required": ["audio_base64"]
+        }
+    ),
+)
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available sensory tools."""
-    return [
-        Tool(
-            name="morse_encode",
-            description="Encode text to Morse code. Formats: standard (.-), visual (█▄), binary (10)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to encode"},
-                    "format": {
-                        "type": "string",
-                        "enum": ["standard", "visual", "binary"],
-                        "default": "standard",
-                        "description": "Output format"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="morse_decode",
-            description="Decode Morse code back to text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "morse": {"type": "string", "description": "Morse code to decode"}
-                },
-                "required": ["morse"]
-            }
-        ),
-        Tool(
-            name="morse_timing",
-            description="Get timing data for Morse audio/light generation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to convert"},
-                    "unit_ms": {"type": "integer", "default": 100, "description": "Base time unit in milliseconds"}
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="braille_encode",
-            description="Encode text to Braille Unicode characters",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to encode"}
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="braille_decode",
-            description="Decode Braille back to text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "braille": {"type": "string", "description": "Braille text to decode"}
-                },
-                "required": ["braille"]
-            }
-        ),
-        Tool(
-            name="braille_punchcard",
-            description="Generate ASCII punchcard pattern from text - can be physically punched for audit trail!",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to convert"},
-                    "cell_width": {"type": "integer", "default": 4, "description": "Width of each cell"},
-                    "cell_height": {"type": "integer", "default": 6, "description": "Height of each cell"}
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="braille_binary_grid",
-            description="Generate binary grid for machine-readable punchcard or CNC/laser cutting",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to convert"}
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="transcode",
-            description="Convert between different sensory encodings",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input": {"type": "string", "description": "Input data"},
-                    "from_format": {
-                        "type": "string",
-                        "enum": ["text", "morse", "braille"],
-                        "description": "Source format"
-                    },
-                    "to_format": {
-                        "type": "string",
-                        "enum": ["text", "morse", "braille", "morse_visual", "punchcard"],
-                        "description": "Target format"
-                    }
-                },
-                "required": ["input", "from_format", "to_format"]
-            }
-        ),
-        # SSTV Tools - "Een 7B model krijgt opeens ogen"
-        Tool(
-            name="sstv_encode_text",
-            description="Encode text to SSTV audio (Robot36/Martin/Scottie). Returns base64 WAV. Multi-modal bridge for small LLMs!",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to encode into image then SSTV audio"},
-                    "mode": {
-                        "type": "string",
-                        "enum": ["robot36", "robot8bw", "robot24bw", "martin1", "martin2", "scottie1", "scottie2"],
-                        "default": "robot36",
-                        "description": "SSTV mode (robot36 is fastest)"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="sstv_encode_ponskaart",
-            description="Create authenticated ponskaart (punch card) for McMurdo remote authentication via SSTV",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "auth_token": {"type": "string", "description": "Authentication token"},
-                    "command": {"type": "string", "description": "Command to execute remotely"},
-                    "mode": {
-                        "type": "string",
-                        "enum": ["robot36", "robot8bw", "robot24bw", "martin1", "martin2", "scottie1", "scottie2"],
-                        "default": "robot36",
-                        "description": "SSTV mode"
-                    }
-                },
-                "required": ["user_id", "auth_token", "command"]
-            }
-        ),
-        Tool(
-            name="sstv_modes",
-            description="List available SSTV modes with their specifications",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        # SSTV Decode - Complete the REFLUX loop!
-        Tool(
-            name="sstv_detect",
-            description="Detect if audio contains an SSTV signal. First step of REFLUX decode.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "audio_base64": {"type": "string", "description": "Base64 encoded WAV audio"}
-                },
-                "required": ["audio_base64"]
-            }
-        ),
-        Tool(
-            name="sstv_decoder_info",
-            description="Get SSTV decoder capabilities and REFLUX readiness status",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="reflux_decode",
-            description="Complete REFLUX decode: SSTV Audio → Image → OCR → Text. Gives small LLMs 'eyes' via audio!",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "audio_base64": {"type": "string", "description": "Base64 encoded SSTV WAV audio"}
-                },
-                "required": ["audio_base64"]
-            }
-        ),
-    ]
+    return list(_TOOLS)
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls."""
+# morse_encode "format" argument -> MorseFormat
+_MORSE_FORMATS = {
+    "standard": morse.MorseFormat.STANDARD,
+    "visual": morse.MorseFormat.VISUAL,
+    "binary": morse.MorseFormat.BINARY,
+}
 
-    if name == "morse_encode":
-        text = arguments["text"]
-        fmt = arguments.get("format", "standard")
-        format_enum = {
-            "standard": morse.MorseFormat.STANDARD,
-            "visual": morse.MorseFormat.VISUAL,
-            "binary": morse.MorseFormat.BINARY
-        }.get(fmt, morse.MorseFormat.STANDARD)
-
-        result = morse.encode(text, format_enum)
-        return [TextContent(type="text", text=result)]
-
-    elif name == "morse_decode":
-        morse_code = arguments["morse"]
-        result = morse.decode(morse_code)
-        return [TextContent(type="text", text=result)]
-
-    elif name == "morse_timing":
-        text = arguments["text"]
-        unit_ms = arguments.get("unit_ms", 100)
-        morse_code = morse.encode(text)
-        timing = morse.to_timing(morse_code, unit_ms)
-        return [TextContent(type="text", text=json.dumps(timing))]
-
-    elif name == "braille_encode":
-        text = arguments["text"]
-        result = braille.encode(text)
-        return [TextContent(type="text", text=result)]
-
-    elif name == "braille_decode":
-        braille_text = arguments["braille"]
-        result = braille.decode(braille_text)
-        return [TextContent(type="text", text=result)]
-
-    elif name == "braille_punchcard":
-        text = arguments["text"]
-        cell_width = arguments.get("cell_width", 4)
-        cell_height = arguments.get("cell_height", 6)
-        result = braille.to_punchcard_pattern(text, cell_width, cell_height)
-        return [TextContent(type="text", text=result)]
-
-    elif name == "braille_binary_grid":
-        text = arguments["text"]
-        grid = braille.to_binary_grid(text)
-        return [TextContent(type="text", text=json.dumps(grid))]
-
-    elif name == "transcode":
-        input_data = arguments["input"]
-        from_fmt = arguments["from_format"]
-        to_fmt = arguments["to_format"]
-
-        # First convert to text
-        if from_fmt == "morse":
-            text = morse.decode(input_data)
-        elif from_fmt == "braille":
-            text = braille.decode(input_data)
-        else:
-            text = input_data
-
-        # Then convert to target
-        if to_fmt == "morse":
-            result = morse.encode(text)
-        elif to_fmt == "morse_visual":
-            result = morse.encode(text, morse.MorseFormat.VISUAL)
-        elif to_fmt == "braille":
-            result = braille.encode(text)
-        elif to_fmt == "punchcard":
-            result = braille.to_punchcard_pattern(text)
-        else:
-            result = text
-
-        return [TextContent(type="text", text=result)]
-
-    # SSTV Tools
-    elif name == "sstv_encode_text":
-        text = arguments["text"]
-        mode = arguments.get("mode", "robot36")
-        try:
-            audio_bytes = sstv.encode_text(text, mode)
-            audio_b64 = base64.b64encode(audio_bytes).decode()
-            result = {
-                "status": "success",
-                "mode": mode,
-                "text_length": len(text),
-                "audio_bytes": len(audio_bytes),
-                "audio_base64": audio_b64[:100] + "...[truncated]",
-                "full_audio_base64": audio_b64,
-                "note": "Multi-modal bridge: text -> image -> SSTV audio"
-            }
-            return [TextContent(type="text", text=json.dumps(result))]
-        except ImportError as e:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": "pysstv not installed. Run: pip install mcp-server-sensory[sstv]"
-            }))]
-        except Exception as e:
-            return [TextContent(type="text", text=json.dumps({"status": "error", "error": str(e)}))]
-
-    elif name == "sstv_encode_ponskaart":
-        user_id = arguments["user_id"]
-        auth_token = arguments["auth_token"]
-        command = arguments["command"]
-        mode = arguments.get("mode", "robot36")
-        try:
-            audio_bytes = sstv.encode_ponskaart(user_id, auth_token, command, mode)
-            audio_b64 = base64.b64encode(audio_bytes).decode()
-            result = {
-                "status": "success",
-                "mode": mode,
-                "ponskaart": {
-                    "user": user_id,
-                    "command": command,
-                    "auth_prefix": auth_token[:8] + "..."
-                },
-                "audio_bytes": len(audio_bytes),
-                "full_audio_base64": audio_b64,
-                "note": "McMurdo authentication ponskaart - transmit via radio when network fails"
-            }
-            return [TextContent(type="text", text=json.dumps(result))]
-        except ImportError as e:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": "pysstv not installed. Run: pip install mcp-server-sensory[sstv]"
-            }))]
-        except Exception as e:
-            return [TextContent(type="text", text=json.dumps({"status": "error", "error": str(e)}))]
-
-    elif name == "sstv_modes":
-        modes = sstv.get_available_modes() if hasattr(sstv, 'get_available_modes') else []
-        mode_info = {}
-        for m in modes:
-            info = sstv.get_mode_info(m) if hasattr(sstv, 'get_mode_info') else {}
-            mode_info[m] = info
+
+async def _handle_morse_encode(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    fmt = arguments.get("format", "standard")
+    format_enum = _MORSE_FORMATS.get(fmt, morse.MorseFormat.STANDARD)
+
+    result = await _run(_morse_encode, text, format_enum)
+    return [_tc(result)]
+
+
+async def _handle_morse_decode(arguments: dict) -> list[TextContent]:
+    morse_code = arguments["morse"]
+    result = await _run(_morse_decode, morse_code)
+    return [_tc(result)]
+
+
+async def _handle_morse_timing(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    unit_ms = arguments.get("unit_ms", 100)
+    result = await _run(_morse_timing_json, text, unit_ms)
+    return [_tc(result)]
+
+
+async def _handle_braille_encode(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    result = await _run(_braille_encode, text)
+    return [_tc(result)]
+
+
+async def _handle_braille_decode(arguments: dict) -> list[TextContent]:
+    braille_text = arguments["braille"]
+    result = await _run(_braille_decode, braille_text)
+    return [_tc(result)]
+
+
+async def _handle_braille_punchcard(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    cell_width = arguments.get("cell_width", 4)
+    cell_height = arguments.get("cell_height", 6)
+    if _punchcard_size(text, cell_width, cell_height) <= _CHUNK_CHARS:
+        result = await _run(_braille_punchcard, text, cell_width, cell_height)
+        return [_tc(result)]
+
+    # Stream big patterns row by row instead of building one huge string;
+    # the blocks concatenate to the full pattern
+    chunks = await asyncio.to_thread(_punchcard_chunks, text, cell_width, cell_height)
+    return [_tc(chunk) for chunk in chunks]
+
+
+async def _handle_braille_binary_grid(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    result = await _run(_braille_grid_json, text)
+    return [_tc(result)]
+
+
+async def _handle_transcode(arguments: dict) -> list[TextContent]:
+    input_data = arguments["input"]
+    from_fmt = arguments["from_format"]
+    to_fmt = arguments["to_format"]
+
+    # Nothing to convert
+    if from_fmt == to_fmt:
+        return [_tc(input_data)]
+
+    pipeline = _TRANSCODE.get((from_fmt, to_fmt))
+    if pipeline is None:
+        # Unknown formats are treated as plain text
+        pipeline = _pipeline(
+            _TRANSCODE_DECODERS.get(from_fmt),
+            _TRANSCODE_ENCODERS.get(to_fmt),
+        )
+    result = await _run(pipeline, input_data) if pipeline else input_data
+
+    return [_tc(result)]
+
+
+# SSTV Tools
+async def _handle_sstv_encode_text(arguments: dict) -> list[TextContent]:
+    text = arguments["text"]
+    mode = arguments.get("mode", "robot36")
+    try:
+        audio_bytes = sstv.encode_text(text, mode)
+        audio_b64 = base64.b64encode(audio_bytes).decode()
         result = {
             "status": "success",
-            "available_modes": modes,
-            "mode_details": mode_info,
-            "note": "SSTV = Slow Scan Television. Used by ham radio operators to send images over audio."
+            "mode": mode,
+            "text_length": len(text),
+            "audio_bytes": len(audio_bytes),
+            "audio_base64": audio_b64[:100] + "...[truncated]",
+            "full_audio_base64": audio_b64,
+            "note": "Multi-modal bridge: text -> image -> SSTV audio"
         }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [_tc(json.dumps(result))]
+    except ImportError as e:
+        return [_tc(json.dumps({
+            "status": "error",
+            "error": "pysstv not installed. Run: pip install mcp-server-sensory[sstv]"
+        }))]
+    except Exception as e:
+        return [_tc(json.dumps({"status": "error", "error": str(e)}))]
+
+
+async def _handle_sstv_encode_ponskaart(arguments: dict) -> list[TextContent]:
+    user_id = arguments["user_id"]
+    auth_token = arguments["auth_token"]
+    command = arguments["command"]
+    mode = arguments.get("mode", "robot36")
+    try:
+        audio_bytes = sstv.encode_ponskaart(user_id, auth_token, command, mode)
+        audio_b64 = base64.b64encode(audio_bytes).decode()
+        result = {
+            "status": "success",
+            "mode": mode,
+            "ponskaart": {
+                "user": user_id,
+                "command": command,
+                "auth_prefix": auth_token[:8] + "..."
+            },
+            "audio_bytes": len(audio_bytes),
+            "full_audio_base64": audio_b64,
+            "note": "McMurdo authentication ponskaart - transmit via radio when network fails"
+        }
+        return [_tc(json.dumps(result))]
+    except ImportError as e:
+        return [_tc(json.dumps({
+            "status": "error",
+            "error": "pysstv not installed. Run: pip install mcp-server-sensory[sstv]"
+        }))]
+    except Exception as e:
+        return [_tc(json.dumps({"status": "error", "error": str(e)}))]
+
+
+async def _handle_sstv_modes(arguments: dict) -> list[TextContent]:
+    modes = sstv.get_available_modes() if hasattr(sstv, 'get_available_modes') else []
+    mode_info = {}
+    for m in modes:
+        info = sstv.get_mode_info(m) if hasattr(sstv, 'get_mode_info') else {}
+        mode_info[m] = info
+    result = {
+        "status": "success",
+        "available_modes": modes,
+        "mode_details": mode_info,
+        "note": "SSTV = Slow Scan Television. Used by ham radio operators to send images over audio."
+    }
+    return [_tc(json.dumps(result, indent=2))]
+
+
+# SSTV Decode / REFLUX tools
+async def _handle_sstv_detect(arguments: dict) -> list[TextContent]:
+    audio_b64 = arguments["audio_base64"]
+    try:
+        audio_bytes = base64.b64decode(audio_b64)
+        result = sstv_decoder.detect_sstv_signal(audio_bytes)
+        return [_tc(json.dumps(result, indent=2))]
+    except Exception as e:
+        return [_tc(json.dumps({
+            "status": "error",
+            "error": str(e)
+        }))]
+
+
+async def _handle_sstv_decoder_info(arguments: dict) -> list[TextContent]:
+    result = sstv_decoder.get_decoder_info()
+    result["concept"] = "REFLUX: Text → Image → SSTV Audio → Radio → Audio → Image → OCR → Text"
+    result["purpose"] = "Give 'eyes' to text-only LLMs via audio pathway"
+    return [_tc(json.dumps(result, indent=2))]
+
+
+async def _handle_reflux_decode(arguments: dict) -> list[TextContent]:
+    audio_b64 = arguments["audio_base64"]
+    try:
+        audio_bytes = base64.b64decode(audio_b64)
+        result = sstv_decoder.reflux_decode(audio_bytes)
+        return [_tc(json.dumps(result, indent=2))]
+    except Exception as e:
+        return [_tc(json.dumps({
+            "status": "error",
+            "error": str(e),
+            "note": "REFLUX decode failed. Check audio format (WAV, mono, 16-bit)"
+        }))]
+
+
+# Tool name -> handler, so dispatch is a single dict lookup
+_HANDLERS = {
+    "morse_encode": _handle_morse_encode,
+    "morse_decode": _handle_morse_decode,
+    "morse_timing": _handle_morse_timing,
+    "braille_encode": _handle_braille_encode,
+    "braille_decode": _handle_braille_decode,
+    "braille_punchcard": _handle_braille_punchcard,
+    "braille_binary_grid": _handle_braille_binary_grid,
+    "transcode": _handle_transcode,
+    "sstv_encode_text": _handle_sstv_encode_text,
+    "sstv_encode_ponskaart": _handle_sstv_encode_ponskaart,
+    "sstv_modes": _handle_sstv_modes,
+    "sstv_detect": _handle_sstv_detect,
+    "sstv_decoder_info": _handle_sstv_decoder_info,
+    "reflux_decode": _handle_reflux_decode,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [_tc(f"Unknown tool: {name}")]
+    return await handler(arguments)
 
-    # SSTV Decode / REFLUX tools
-    elif name == "sstv_detect":
-        audio_b64 = arguments["audio_base64"]
-        try:
-            audio_bytes = base64.b64decode(audio_b64)
-            result = sstv_decoder.detect_sstv_signal(audio_bytes)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except Exception as e:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": str(e)
-            }))]
-
-    elif name == "sstv_decoder_info":
-        result = sstv_decoder.get_decoder_info()
-        result["concept"] = "REFLUX: Text → Image → SSTV Audio → Radio → Audio → Image → OCR → Text"
-        result["purpose"] = "Give 'eyes' to text-only LLMs via audio pathway"
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "reflux_decode":
-        audio_b64 = arguments["audio_base64"]
-        try:
-            audio_bytes = base64.b64decode(audio_b64)
-            result = sstv_decoder.reflux_decode(audio_bytes)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except Exception as e:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": str(e),
-                "note": "REFLUX decode failed. Check audio format (WAV, mono, 16-bit)"
-            }))]
 
-    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+# Capabilities are derived from the registered handlers, so this has to be
+# built after the decorators above have run
+_INIT_OPTS = server.create_initialization_options()
 
 
 def main():
     """Run the MCP server."""
     async def run():
         async with stdio_server() as (read_stream, write_stream):
-            await server.run(read_stream, write_stream, server.create_initialization_options())
+            await server.run(read_stream, write_stream, _INIT_OPTS)
 
     asyncio.run(run())
 